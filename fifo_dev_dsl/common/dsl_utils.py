@@ -1,3 +1,15 @@
+import re
+
+# Tokens relevant to `split_top_level_commas`: complete quoted strings (a backslash
+# escapes the next character), lone quotes that are never closed, group delimiters
+# and commas.
+_TOP_LEVEL_TOKEN_PATTERN = re.compile(
+    r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|['"()\[\]{},]""",
+    re.DOTALL,
+)
+
+_OPENING_FOR_CLOSING = {')': '(', ']': '[', '}': '{'}
+
 def split_top_level_commas(args_str: str) -> list[str]:
     """
     Splits a DSL argument string at top-level commas, ignoring commas within nested 
@@ -45,57 +57,47 @@ def split_top_level_commas(args_str: str) -> list[str]:
     """
     args: list[str] = []
     stack: list[str] = []
-    current = ''
-    in_quote: str | None = None
-    i = 0
-
-    while i < len(args_str):
-        c = args_str[i]
-
-        if in_quote:
-            if c == '\\' and i + 1 < len(args_str):
-                current += c + args_str[i + 1]
-                i += 2
-                continue
-            elif c == in_quote:
-                in_quote = None
-            current += c
-        else:
-            if c in ("'", '"'):
-                in_quote = c
-                current += c
-            elif c in '([{':
-                stack.append(c)
-                current += c
-            elif c in ')]}':
-                if not stack:
-                    raise ValueError(f"Unmatched closing '{c}' at position {i}")
-                opening = stack.pop()
-                if (opening, c) not in [('(', ')'), ('[', ']'), ('{', '}')]:
-                    raise ValueError(f"Mismatched group: '{opening}' "
-                                     f"closed by '{c}' at position {i}")
-                current += c
-            elif c == ',' and not stack:
-                stripped = current.strip()
-                if not stripped:
-                    raise ValueError(f"Empty top-level argument at position {i}")
-
-                args.append(stripped)
-                current = ''
-            else:
-                current += c
-
-        i += 1
-
-    if in_quote:
-        raise ValueError("Unterminated string literal")
+    start = 0
+
+    # Only quoted strings, group delimiters and commas are structurally relevant, so
+    # the scanner jumps from one of them to the next and arguments are sliced out of
+    # the input rather than accumulated character by character.
+    for match in _TOP_LEVEL_TOKEN_PATTERN.finditer(args_str):
+        token = match.group()
+        i = match.start()
+
+        if len(token) > 1:
+            # Complete quoted string, commas and delimiters inside it are ignored
+            continue
+
+        if token in "'\"":
+            # A lone quote is one that the quoted string alternatives could not close
+            raise ValueError("Unterminated string literal")
+
+        if token in '([{':
+            stack.append(token)
+        elif token in ')]}':
+            if not stack:
+                raise ValueError(f"Unmatched closing '{token}' at position {i}")
+            opening = stack.pop()
+            if opening != _OPENING_FOR_CLOSING[token]:
+                raise ValueError(f"Mismatched group: '{opening}' "
+                                 f"closed by '{token}' at position {i}")
+        elif not stack:
+            stripped = args_str[start:i].strip()
+            if not stripped:
+                raise ValueError(f"Empty top-level argument at position {i}")
+
+            args.append(stripped)
+            start = match.end()
 
     if stack:
         raise ValueError("Unbalanced or mismatched grouping in DSL expression")
 
-    if current.strip():
-        args.append(current.strip())
-    elif current.strip() == '' and args_str.strip().endswith(','):
+    tail = args_str[start:].strip()
+    if tail:
+        args.append(tail)
+    elif args_str.strip().endswith(','):
         raise ValueError("Trailing empty top-level argument")
 
     return args
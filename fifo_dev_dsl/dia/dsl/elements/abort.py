@@ -18,8 +18,22 @@ class Abort(DslBase):
     execution branch, and moves to the execution of the next intent.
     This node is typically injected when the user cancels the conversation
     or explicitly requests to stop processing.
+
+    The node is stateless: all instances compare equal, and the parser shares a
+    single instance (see `abort()`), which copies preserve.
     """
 
+    __slots__ = ()
+
+    def __hash__(self) -> int:
+        return hash(self.__class__)
+
+    def __copy__(self) -> Abort:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Abort:
+        return self
+
     def to_dsl_representation(self) -> str:
         """
         Return the DSL-style representation of the Abort node.
@@ -83,3 +97,17 @@ class Abort(DslBase):
                 Unresolved DSL node: Abort
         """
         raise RuntimeError(f"Unresolved DSL node: {self.__class__.__name__}")
+
+
+_ABORT = Abort()
+
+
+def abort() -> Abort:
+    """
+    Return the shared `Abort` instance.
+
+    Returns:
+        Abort:
+            The flyweight instance used for every `ABORT()` node.
+    """
+    return _ABORT
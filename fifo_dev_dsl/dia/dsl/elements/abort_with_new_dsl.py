@@ -26,6 +26,8 @@ class AbortWithNewDsl(DslBase):
             DSL elements that will replace the aborted intent subtree.
     """
 
+    __slots__ = ("new_dsl",)
+
     new_dsl: ListElement
 
     def to_dsl_representation(self) -> str:
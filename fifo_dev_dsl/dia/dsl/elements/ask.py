@@ -36,8 +36,16 @@ class Ask(DslBase):
         )
     """
 
+    __slots__ = ("question", "_dsl_repr", "_dsl_repr_source")
+
     question: str
 
+    def __post_init__(self) -> None:
+        # The DSL representation is rendered on first use and reused until `question`
+        # is reassigned (None never matches the text it was rendered from).
+        self._dsl_repr = ""
+        self._dsl_repr_source: str | None = None
+
     def to_dsl_representation(self) -> str:
         """
         Return the DSL-style representation of the Ask node.
@@ -47,7 +55,11 @@ class Ask(DslBase):
                 The question in DSL syntax, with internal quotes escaped and the string properly
                 quoted. For example: ASK("question").
         """
-        return f'ASK({quote_and_escape(self.question)})'
+        question = self.question
+        if self._dsl_repr_source is not question:
+            self._dsl_repr = f'ASK({quote_and_escape(question)})'
+            self._dsl_repr_source = question
+        return self._dsl_repr
 
     def do_resolution(
         self,
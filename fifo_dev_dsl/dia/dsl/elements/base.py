@@ -1,4 +1,5 @@
 from __future__ import annotations
+import copy
 from abc import ABC
 from typing import TYPE_CHECKING, Any, Generic, Type, TypeVar, cast
 
@@ -8,6 +9,24 @@ from fifo_dev_dsl.common.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Immutable types that `copy.deepcopy()` returns as-is, copied by reference without the call.
+_ATOMIC_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# Slot names declared along the MRO of each DSL node class, collected on first copy.
+_SLOT_NAMES: dict[type, tuple[str, ...]] = {}
+
+def _slot_names(cls: type) -> tuple[str, ...]:
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        collected: list[str] = []
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            collected.extend(name for name in slots if name not in ("__dict__", "__weakref__"))
+        names = _SLOT_NAMES[cls] = tuple(collected)
+    return names
+
 if TYPE_CHECKING:  # pragma: no cover
     from fifo_dev_dsl.dia.resolution.interaction import Interaction
     from fifo_dev_dsl.dia.resolution.context import ResolutionContext
@@ -24,8 +43,47 @@ class DslBase:
 
     Subclasses override `resolve()` to participate in specific resolution phases,
     and `eval()` if they produce a concrete value during execution.
+
+    DSL nodes declare `__slots__` so that large trees do not pay for a
+    per-instance `__dict__`.
     """
 
+    __slots__ = ()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> DslBase:
+        """
+        Return a deep copy of this node and its subtree.
+
+        Equivalent to the default `copy.deepcopy()` behavior, but copies the declared
+        slots directly instead of going through `__reduce_ex__()`, and shares immutable
+        scalars (strings, numbers, booleans, None) without a nested `copy.deepcopy()`
+        call. Resolvers and evaluators deep-copy whole DSL trees, so this runs for every
+        node in them.
+
+        Args:
+            memo (dict[int, Any]):
+                The `copy.deepcopy()` memo, used to preserve shared references.
+
+        Returns:
+            DslBase:
+                A new node of the same type holding deep copies of this node's state.
+        """
+        cls = type(self)
+        clone = cls.__new__(cls)
+        memo[id(self)] = clone
+        for name in _slot_names(cls):
+            try:
+                value = getattr(self, name)
+            except AttributeError:
+                continue
+            if type(value) not in _ATOMIC_TYPES:
+                value = copy.deepcopy(value, memo)
+            setattr(clone, name, value)
+        state = getattr(self, "__dict__", None)
+        if state:
+            clone.__dict__.update(copy.deepcopy(state, memo))
+        return clone
+
     def to_dsl_representation(self) -> str:
         """
         Return a DSL-style string representation of this node.
@@ -113,8 +171,10 @@ class DslBase:
     def _log_resolution(self,
                         label: str,
                         resolution_context: ResolutionContext):
+        # Lazy %-formatting: the node repr covers its whole subtree and this runs for
+        # every resolution hook, so it is only rendered when TRACE is enabled.
         pad = "  " * len(resolution_context.call_stack)
-        logger.trace(f"{pad}[{label:<8}] {self}")
+        logger.trace("%s[%-8s] %s", pad, label, self)
 
     def pre_resolution(
         self,
@@ -340,6 +400,8 @@ class DslContainerBase(DslBase, Generic[T], ABC):
             A list of child DSL nodes stored in the order they were provided.
     """
 
+    __slots__ = ("_items",)
+
     _items: list[T]
 
     def __init__(self, items: list[T]):
@@ -497,6 +559,8 @@ def make_dsl_container(expected_type: Type[T]) -> type[DslContainerBase[T]]:
     """
     # `Any` avoids a Pylance warning about reusing the outer TypeVar `_CT`
     class _GeneratedContainer(DslContainerBase[Any]):
+        __slots__ = ()
+
         def _expected_type(self) -> Type[T]:
             return expected_type
     _GeneratedContainer.__name__ = f"{expected_type.__name__}ListBase"
@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
-
+from typing import TYPE_CHECKING, Any, Iterator
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 from fifo_dev_dsl.dia.dsl.elements.base import DslBase, make_dsl_container
 
@@ -26,6 +27,33 @@ class ListElement(make_dsl_container(DslBase)):
             )
     """
 
+    __slots__ = ()
+
+    def eval_iter(
+        self,
+        runtime_context: LLMRuntimeContext,
+    ) -> Iterator[Any]:
+        """
+        Lazily evaluate each child and yield their values in order.
+
+        Each child is evaluated only when the next value is requested, so callers
+        that stop early (e.g., on the first failure or once enough results were
+        displayed) do not evaluate, nor keep in memory, the remaining children.
+
+        Args:
+            runtime_context (LLMRuntimeContext):
+                Execution context providing tool access, query sources, and runtime helpers.
+
+        Yields:
+            Any:
+                The value of each evaluated child.
+
+        Raises:
+            RuntimeError: If a child is not resolved when it is reached.
+        """
+        for child in self.get_items():
+            yield child.eval(runtime_context)
+
     def eval(
         self,
         runtime_context: LLMRuntimeContext,
@@ -47,7 +75,7 @@ class ListElement(make_dsl_container(DslBase)):
         Raises:
             RuntimeError: If any child is not resolved.
         """
-        return [child.eval(runtime_context) for child in self.get_items()]
+        return list(self.eval_iter(runtime_context))
 
     async def eval_async(
         self,
@@ -74,3 +102,61 @@ class ListElement(make_dsl_container(DslBase)):
             await child.eval_async(runtime_context)
             for child in self.get_items()
         ]
+
+    def eval_concurrent(
+        self,
+        runtime_context: LLMRuntimeContext,
+        max_workers: int = 8,
+    ) -> list[Any]:
+        """
+        Evaluate all children concurrently on a thread pool and return their values.
+
+        This is an opt-in alternative to `eval()` for children that are independent
+        from each other and mostly wait on I/O (e.g., tools calling remote services).
+        Unlike `eval()`, the order in which the children run is not guaranteed, so it
+        must not be used for side-effecting intents whose order matters. The returned
+        list always follows the order of the children.
+
+        Args:
+            runtime_context (LLMRuntimeContext):
+                Execution context providing tool access, query sources, and runtime helpers.
+
+            max_workers (int):
+                Maximum number of children evaluated at the same time.
+
+        Returns:
+            list[Any]:
+                The list of evaluated child values.
+
+        Raises:
+            RuntimeError: If any child is not resolved.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda child: child.eval(runtime_context), self.get_items()))
+
+    async def eval_async_concurrent(
+        self,
+        runtime_context: LLMRuntimeContext,
+    ) -> list[Any]:
+        """
+        Asynchronously evaluate all children concurrently and return their values.
+
+        This is an opt-in alternative to `eval_async()` that awaits all children with
+        `asyncio.gather`. The same restrictions as `eval_concurrent()` apply: the
+        children must be independent, as their evaluation may interleave. The returned
+        list always follows the order of the children.
+
+        Args:
+            runtime_context (LLMRuntimeContext):
+                Execution context providing tool access, query sources, and runtime helpers.
+
+        Returns:
+            list[Any]:
+                The list of evaluated child values.
+
+        Raises:
+            RuntimeError: If any child is not resolved.
+        """
+        return list(await asyncio.gather(
+            *(child.eval_async(runtime_context) for child in self.get_items())
+        ))
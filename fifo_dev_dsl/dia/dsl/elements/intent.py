@@ -30,13 +30,21 @@ class Intent(make_dsl_container(Slot)):
     Attributes:
         name (str):
             The name of the tool to invoke.
+
+        _slots_dsl_cache (list[str] | None):
+            DSL representation of each slot value, in slot order. Built when a
+            resolution pass enters the intent and dropped when it leaves it; None
+            outside of a pass.
     """
 
+    __slots__ = ("name", "_slots_dsl_cache")
+
     name: str
 
     def __init__(self, name: str, slots: list[Slot]):
         super().__init__(slots)
         self.name = name
+        self._slots_dsl_cache: list[str] | None = None
 
     def __eq__(self, other: Any) -> bool:
         return (
@@ -60,6 +68,48 @@ class Intent(make_dsl_container(Slot)):
         """
         return self.get_items()
 
+    def get_slots_dsl_representation(self) -> dict[str, str]:
+        """
+        Return the DSL representation of every slot value, keyed by slot name.
+
+        During a resolution pass the slot values are rendered once, when the pass enters
+        the intent, and shared by the `Slot.pre_resolution` calls of all the slots of
+        this intent, so that resolving K slots does not re-render the K sibling values
+        each time. Outside of a pass the values are rendered on every call.
+
+        Returns:
+            dict[str, str]:
+                Slot names mapped to the DSL representation of their value, in slot order.
+                If several slots share a name, the last one wins.
+        """
+        texts = self._slots_dsl_cache
+        if texts is None:
+            texts = self._render_slots_dsl()
+        return {slot.name: text for slot, text in zip(self._items, texts)}
+
+    def _render_slots_dsl(self) -> list[str]:
+        return [slot.value.to_dsl_representation() for slot in self._items]
+
+    def refresh_slot_dsl_representation(self, slot: Slot) -> None:
+        """
+        Update the cached DSL representation of one of this intent's slots.
+
+        Called once a slot has been resolved, as its value may have been replaced or
+        expanded during resolution. Slots that do not belong to this intent (e.g.,
+        slots of a `PropagateSlots` node) are ignored.
+
+        Args:
+            slot (Slot):
+                The slot whose value may have changed.
+        """
+        texts = self._slots_dsl_cache
+        if texts is None:
+            return
+        for index, item in enumerate(self._items):
+            if item is slot:
+                texts[index] = slot.value.to_dsl_representation()
+                return
+
     def to_dsl_representation(self) -> str:
         """
         Return the DSL-style representation of the intent.
@@ -87,8 +137,8 @@ class Intent(make_dsl_container(Slot)):
                 pslot_value = pslots.get(slot.name)
                 if pslot_value is not None:
                     logger.trace(
-                        f"--> propagating slots {slot.name}, "
-                        f"{slot.value} replaced by {pslot_value} "
+                        "--> propagating slots %s, %s replaced by %s ",
+                        slot.name, slot.value, pslot_value
                     )
                     slot.value = pslot_value
                     updated.add(slot.name)
@@ -98,6 +148,9 @@ class Intent(make_dsl_container(Slot)):
                 if name not in updated:
                     self._items.append(Slot(name, value))
 
+            if self._slots_dsl_cache is not None:
+                self._slots_dsl_cache = self._render_slots_dsl()
+
     def pre_resolution(
         self,
         runtime_context: LLMRuntimeContext,
@@ -105,6 +158,7 @@ class Intent(make_dsl_container(Slot)):
         interaction: Interaction | None,
     ) -> None:
         super().pre_resolution(runtime_context, resolution_context, interaction)
+        self._slots_dsl_cache = self._render_slots_dsl()
         resolution_context.entering_intent(self)
 
     def post_resolution(
@@ -114,6 +168,7 @@ class Intent(make_dsl_container(Slot)):
         interaction: Interaction | None,
     ) -> None:
         super().post_resolution(runtime_context, resolution_context, interaction)
+        self._slots_dsl_cache = None
         resolution_context.exiting_intent()
 
     def on_reentry_resolution(
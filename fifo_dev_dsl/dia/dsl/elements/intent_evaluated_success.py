@@ -33,6 +33,8 @@ class IntentEvaluatedSuccess(DslBase):
             The result of evaluating the intent, including its return value and status.
     """
 
+    __slots__ = ("intent", "evaluation_outcome")
+
     intent: Intent
     evaluation_outcome: EvaluationOutcome
 
@@ -40,6 +40,8 @@ class IntentRuntimeErrorResolver(DslBase):
             A human-readable description of the failure.
     """
 
+    __slots__ = ("intent", "error_message")
+
     intent: Intent
     error_message: str
 
@@ -25,6 +25,8 @@ class PropagateSlots(make_dsl_container(Slot)):
         Result: value = 5, PropagateSlots([Slot("length", Value("10"))])
     """
 
+    __slots__ = ()
+
     def __init__(self, slots: list[Slot]):
         super().__init__(slots)
 
@@ -41,8 +41,16 @@ class QueryFill(DslBase):
         retrieve_screw(count=6, length=QUERY_FILL("longest length you have"))
     """
 
+    __slots__ = ("query", "_dsl_repr", "_dsl_repr_source")
+
     query: str
 
+    def __post_init__(self) -> None:
+        # The DSL representation is rendered on first use and reused until `query`
+        # is reassigned (None never matches the text it was rendered from).
+        self._dsl_repr = ""
+        self._dsl_repr_source: str | None = None
+
     def is_resolved(self) -> bool:
         """
         Indicate that this node has not yet been resolved.
@@ -66,7 +74,11 @@ class QueryFill(DslBase):
                 The query in DSL syntax, with internal quotes escaped and the value properly quoted.
                 For example: QUERY_FILL("query").
         """
-        return f'QUERY_FILL({quote_and_escape(self.query)})'
+        query = self.query
+        if self._dsl_repr_source is not query:
+            self._dsl_repr = f'QUERY_FILL({quote_and_escape(query)})'
+            self._dsl_repr_source = query
+        return self._dsl_repr
 
     def eval(
         self,
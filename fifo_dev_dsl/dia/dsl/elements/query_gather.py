@@ -50,6 +50,8 @@ class QueryGather(DslBase):
                 )
     """
 
+    __slots__ = ("original_intent", "query")
+
     original_intent: str
     query: str
 
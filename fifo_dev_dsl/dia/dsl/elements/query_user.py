@@ -1,5 +1,4 @@
 from __future__ import annotations
-import re
 from typing import TYPE_CHECKING, Any
 
 from dataclasses import dataclass
@@ -21,6 +20,14 @@ if TYPE_CHECKING:  # pragma: no cover
     from fifo_dev_dsl.dia.runtime.context import LLMRuntimeContext
     from fifo_dev_dsl.dia.resolution.context import ResolutionContext
 
+_ANSWER_SEPARATOR = "\nuser friendly answer:"
+
+# Generation settings are identical for every QUERY_USER call, so they are built once.
+_GENERATION_PARAMETERS = GenerationParameters(
+    max_new_tokens=1024,
+    do_sample=False
+)
+
 
 @dataclass
 class QueryUser(DslBase):
@@ -47,6 +54,8 @@ class QueryUser(DslBase):
         Output: QUERY_USER("How many screws do we have in the inventory?")
     """
 
+    __slots__ = ("query",)
+
     query: str
 
     def is_resolved(self) -> bool:
@@ -179,10 +188,7 @@ class QueryUser(DslBase):
                         Message.system(runtime_context.system_prompt_query_user),
                         Message.user(prompt_user)
                     ],
-                    parameters=GenerationParameters(
-                        max_new_tokens=1024,
-                        do_sample=False
-                    ),
+                    parameters=_GENERATION_PARAMETERS,
                     container_name=runtime_context.container_name,
                     host=runtime_context.host
                 )
@@ -196,14 +202,12 @@ class QueryUser(DslBase):
             )
         )
 
-        match = re.search(
-            r"reasoning:\s*(.*?)\nuser friendly answer:(.*)",
-            answer,
-            flags=re.DOTALL
-        )
+        # The answer follows a fixed `reasoning: ...\nuser friendly answer: ...` layout,
+        # so a literal partition is enough to extract the user facing part.
+        head, sep, tail = answer.partition(_ANSWER_SEPARATOR)
 
-        if match:
-            value = match[2].strip()
+        if sep and "reasoning:" in head:
+            value = tail.strip()
         else:
             value = "unknown"
 
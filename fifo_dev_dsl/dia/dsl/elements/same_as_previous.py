@@ -25,8 +25,22 @@ class SameAsPreviousIntent(DSLValueBase):
         Output:
             retrieve_screw(count=2, length=12),
             retrieve_screw(count=4, length=SAME_AS_PREVIOUS_INTENT())
+
+    The node is stateless: all instances compare equal, and the parser shares a
+    single instance (see `same_as_previous_intent()`), which copies preserve.
     """
 
+    __slots__ = ()
+
+    def __hash__(self) -> int:
+        return hash(self.__class__)
+
+    def __copy__(self) -> SameAsPreviousIntent:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> SameAsPreviousIntent:
+        return self
+
     def eval(self,
              runtime_context: LLMRuntimeContext) -> Any:
         """
@@ -68,3 +82,17 @@ class SameAsPreviousIntent(DSLValueBase):
                 The fixed DSL syntax, always returns 'SAME_AS_PREVIOUS_INTENT()'.
         """
         return "SAME_AS_PREVIOUS_INTENT()"
+
+
+_SAME_AS_PREVIOUS_INTENT = SameAsPreviousIntent()
+
+
+def same_as_previous_intent() -> SameAsPreviousIntent:
+    """
+    Return the shared `SameAsPreviousIntent` instance.
+
+    Returns:
+        SameAsPreviousIntent:
+            The flyweight instance used for every `SAME_AS_PREVIOUS_INTENT()` node.
+    """
+    return _SAME_AS_PREVIOUS_INTENT
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import sys
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
@@ -26,7 +27,8 @@ class Slot(make_dsl_container(DslBase)):
 
     Attributes:
         name (str):
-            The name of the argument to bind.
+            The name of the argument to bind. Names are interned, as the same
+            few slot names are repeated across every intent of a DSL tree.
 
     Examples:
         Literal value:
@@ -36,17 +38,49 @@ class Slot(make_dsl_container(DslBase)):
             Slot("target", ReturnValue(Intent(name="get_location", slots=[])))
     """
 
+    __slots__ = ("_name", "_dsl_prefix")
+
     name: str
 
     def __init__(self, name: str, value: DslBase):
         super().__init__([value])
         self.name = name
 
+    @property  # type: ignore[no-redef]
+    def name(self) -> str:
+        """
+        Get the name of the slot.
+
+        Returns:
+            str:
+                The interned argument name.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, new_name: str) -> None:
+        """
+        Set the name of the slot.
+
+        The name is interned, and the `name=` prefix of the DSL representation is
+        rebuilt from it so that `to_dsl_representation()` follows renames.
+
+        Args:
+            new_name (str):
+                The argument name to bind.
+        """
+        self._name = sys.intern(new_name)
+        self._dsl_prefix = sys.intern(f"{self._name}=")
+
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return False
+        # Slot names are interned, so the identity check settles most comparisons
         return (
-                isinstance(other, self.__class__)
-            and self.name == other.name
-            and super().__eq__(other)
+                (self.name is other.name or self.name == other.name)
+            and self._items == other._items
         )
 
     @property
@@ -82,7 +116,7 @@ class Slot(make_dsl_container(DslBase)):
             str:
                 The slot assignment in DSL form, e.g., `count=42`.
         """
-        return f"{self.name}={self.value.to_dsl_representation()}"
+        return self._dsl_prefix + self._items[0].to_dsl_representation()
 
     def pre_resolution(self,
                        runtime_context: LLMRuntimeContext,
@@ -93,17 +127,20 @@ class Slot(make_dsl_container(DslBase)):
         assert resolution_context.intent is not None
 
         resolution_context.slot = self
-        resolution_context.other_slots = {}
-        for slot in resolution_context.intent.get_items():
-            if slot.name != resolution_context.slot.name:
-                value_as_text = slot.value.to_dsl_representation()
-                resolution_context.other_slots[slot.name] = value_as_text
+        resolution_context.other_slots = {
+            name: value_as_text
+            for name, value_as_text
+            in resolution_context.intent.get_slots_dsl_representation().items()
+            if name != self.name
+        }
 
     def post_resolution(self,
                        runtime_context: LLMRuntimeContext,
                        resolution_context: ResolutionContext,
                        interaction: Interaction | None):
         super().post_resolution(runtime_context, resolution_context, interaction)
+        if resolution_context.intent is not None:
+            resolution_context.intent.refresh_slot_dsl_representation(self)
         resolution_context.slot = None
         resolution_context.other_slots = None
 
@@ -7,6 +7,16 @@ from fifo_dev_dsl.dia.dsl.elements.value_base import DSLValueBase
 if TYPE_CHECKING:  # pragma: no cover
     from fifo_dev_dsl.dia.runtime.context import LLMRuntimeContext
 
+
+def _render_dsl(value: Any) -> str:
+    if isinstance(value, str):
+        return f'"{value}"'
+    return str(value)
+
+
+# Values of these exact types cannot change in place, so their rendering is cached.
+_CACHEABLE_TYPES = frozenset((str, int, float, bool))
+
 @dataclass
 class Value(DSLValueBase):
     """
@@ -28,14 +38,32 @@ class Value(DSLValueBase):
         Value(True)       # A boolean constant
     """
 
+    __slots__ = ("value", "_dsl_repr", "_dsl_repr_source")
+
     value: Any
 
+    def __post_init__(self) -> None:
+        self._specialize_dsl_repr()
+
+    def _specialize_dsl_repr(self) -> None:
+        # Immutable values are rendered once, along with the object they were computed
+        # from so that reassigning `value` is detected by `to_dsl_representation()`.
+        # Anything else (e.g. lists) may be mutated in place and is never cached.
+        value = self.value
+        if type(value) in _CACHEABLE_TYPES:
+            self._dsl_repr: str | None = _render_dsl(value)
+        else:
+            self._dsl_repr = None
+        self._dsl_repr_source: Any = value
+
     def to_dsl_representation(self) -> str:
         """
         Return the DSL-style representation of a single value.
 
         All string values are quoted. Non-string values (e.g., numbers)
-        are emitted as-is.
+        are emitted as-is. For strings, numbers and booleans the result
+        is computed at construction and reused until `value` is
+        reassigned; other values are rendered on every call.
 
         Returns:
             str:
@@ -43,9 +71,11 @@ class Value(DSLValueBase):
                 - Strings appear quoted, e.g., `"hello"`
                 - Numbers and other values appear unquoted, e.g., `42`
         """
-        if isinstance(self.value, str):
-            return f'"{self.value}"'
-        return f'{self.value}'
+        if self._dsl_repr_source is not self.value:
+            self._specialize_dsl_repr()
+        if self._dsl_repr is None:
+            return _render_dsl(self.value)
+        return self._dsl_repr
 
     def eval(self,
              runtime_context: LLMRuntimeContext) -> Any:
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import re
 from typing import TYPE_CHECKING, Any
 
 from dataclasses import dataclass
@@ -20,6 +21,9 @@ _FUZZY_TO_NUMERIC: dict[str, int] = {
     "dozens": 24,
 }
 
+# Matches either quote character, so a fuzzy phrase is validated in a single pass.
+_QUOTE_PATTERN = re.compile("[\"']")
+
 
 @dataclass
 class FuzzyValue(DSLValueBase):
@@ -42,15 +46,35 @@ class FuzzyValue(DSLValueBase):
         FuzzyValue("a few") → 3 (after evaluation)
     """
 
+    __slots__ = ("value", "_numeric", "_numeric_source", "_dsl_repr", "_dsl_repr_source")
+
     value: str
 
+    def __post_init__(self) -> None:
+        self._resolve_numeric()
+        # The DSL representation is rendered on first use and reused until `value`
+        # is reassigned (None never matches the phrase it was rendered from).
+        self._dsl_repr = ""
+        self._dsl_repr_source: str | None = None
+
+    def _resolve_numeric(self) -> None:
+        # The numeric value only depends on `value`, so it is looked up once and kept
+        # along with the phrase it was computed from (None if the phrase is unknown or
+        # not a string; `eval()` reports those the same way it always has).
+        value = self.value
+        self._numeric: int | None = (
+            _FUZZY_TO_NUMERIC.get(value.lower().strip()) if isinstance(value, str) else None
+        )
+        self._numeric_source = value
+
     def to_dsl_representation(self) -> str:
         """
         Return the DSL-style representation of the fuzzy value.
 
         Formats the value using the DSL fuzzy marker syntax: F("...").
         Raises an error if the value contains double or single quotes,
-        which are disallowed by the DSL specification.
+        which are disallowed by the DSL specification. The result is
+        reused until `value` is reassigned.
 
         Returns:
             str:
@@ -60,9 +84,13 @@ class FuzzyValue(DSLValueBase):
             ValueError:
                 If the value contains disallowed quote characters.
         """
-        if '"' in self.value or "'" in self.value:
-            raise ValueError("Fuzzy value contains quotes, which are not allowed.")
-        return f'F("{self.value}")'
+        value = self.value
+        if self._dsl_repr_source is not value:
+            if _QUOTE_PATTERN.search(value) is not None:
+                raise ValueError("Fuzzy value contains quotes, which are not allowed.")
+            self._dsl_repr = f'F("{value}")'
+            self._dsl_repr_source = value
+        return self._dsl_repr
 
     def eval(
         self,
@@ -85,6 +113,13 @@ class FuzzyValue(DSLValueBase):
         Raises:
             ValueError: If the fuzzy value is unknown.
         """
+        if self._numeric_source is not self.value:
+            self._resolve_numeric()
+
+        if self._numeric is not None:
+            return self._numeric
+
+        # Non-string values fail on `.lower()` here, exactly as an uncached lookup would.
         normalized = self.value.lower().strip()
         if normalized in _FUZZY_TO_NUMERIC:
             return _FUZZY_TO_NUMERIC[normalized]
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator
+import asyncio
 
 from fifo_dev_dsl.dia.dsl.elements.base import make_dsl_container
 from fifo_dev_dsl.dia.dsl.elements.value_base import DSLValueBase
@@ -23,6 +24,8 @@ class ListValue(make_dsl_container(DSLValueBase), DSLValueBase):
             sum(v=ListValue([Value(1), Value(2), Value(3)])) → 6
     """
 
+    __slots__ = ()
+
     def eval(self,
              runtime_context: LLMRuntimeContext) -> Any:
         """
@@ -39,7 +42,25 @@ class ListValue(make_dsl_container(DSLValueBase), DSLValueBase):
         Raises:
             RuntimeError: If any child is not resolved.
         """
-        return [e.eval(runtime_context) for e in self.get_items()]
+        # Nested `ListValue` children are expanded on an explicit stack rather than by
+        # recursion, so deeply nested lists neither allocate one frame per level nor
+        # hit the interpreter recursion limit. Other children evaluate themselves.
+        result: list[Any] = []
+        stack: list[tuple[Iterator[DSLValueBase], list[Any]]] = [
+            (iter(self.get_items()), result)
+        ]
+        while stack:
+            items, out = stack[-1]
+            for e in items:
+                if type(e) is ListValue:
+                    nested: list[Any] = []
+                    out.append(nested)
+                    stack.append((iter(e.get_items()), nested))
+                    break
+                out.append(e.eval(runtime_context))
+            else:
+                stack.pop()
+        return result
 
     async def eval_async(
         self,
@@ -59,10 +80,51 @@ class ListValue(make_dsl_container(DSLValueBase), DSLValueBase):
         Raises:
             RuntimeError: If any child is not resolved.
         """
-        return [
-            await e.eval_async(runtime_context)
-            for e in self.get_items()
+        # Same explicit-stack traversal as `eval()`.
+        result: list[Any] = []
+        stack: list[tuple[Iterator[DSLValueBase], list[Any]]] = [
+            (iter(self.get_items()), result)
         ]
+        while stack:
+            items, out = stack[-1]
+            for e in items:
+                if type(e) is ListValue:
+                    nested: list[Any] = []
+                    out.append(nested)
+                    stack.append((iter(e.get_items()), nested))
+                    break
+                out.append(await e.eval_async(runtime_context))
+            else:
+                stack.pop()
+        return result
+
+    async def eval_async_concurrent(
+        self,
+        runtime_context: LLMRuntimeContext,
+    ) -> Any:
+        """
+        Asynchronously evaluate all child values concurrently and return a list of results.
+
+        This is an opt-in alternative to `eval_async()` that awaits all children with
+        `asyncio.gather`, so that independent `ReturnValue` children waiting on I/O
+        overlap. Their evaluation may interleave, so it must not be used when the
+        children have side effects whose order matters. The returned list always
+        follows the order of the children.
+
+        Args:
+            runtime_context (LLMRuntimeContext):
+                Execution context providing tool access, query sources, and runtime helpers.
+
+        Returns:
+            list[Any]:
+                The list of evaluated child values.
+
+        Raises:
+            RuntimeError: If any child is not resolved.
+        """
+        return list(await asyncio.gather(
+            *(e.eval_async(runtime_context) for e in self.get_items())
+        ))
 
     def to_dsl_representation(self) -> str:
         """
@@ -74,4 +136,5 @@ class ListValue(make_dsl_container(DSLValueBase), DSLValueBase):
             str:
                 The formatted DSL list representation.
         """
-        return "[" + ", ".join(item.to_dsl_representation() for item in self.get_items()) + "]"
+        items = ", ".join([item.to_dsl_representation() for item in self.get_items()])
+        return f"[{items}]"
@@ -28,6 +28,8 @@ class ReturnValue(DSLValueBase):
             The intent whose evaluated result will be used as the slot value.
     """
 
+    __slots__ = ("intent",)
+
     intent: Intent
 
     def eval(self,
@@ -42,12 +42,13 @@ as slot values are resolved through dialog or context.
 """
 
 
-from typing import Any, Type, TypeVar
+import re
+from typing import Any, Callable, Type, TypeVar
 
 from fifo_dev_common.typeutils.strict_cast import strict_cast
 
 from fifo_dev_dsl.common.dsl_utils import split_top_level_commas, strip_quotes
-from fifo_dev_dsl.dia.dsl.elements.abort import Abort
+from fifo_dev_dsl.dia.dsl.elements.abort import abort
 from fifo_dev_dsl.dia.dsl.elements.abort_with_new_dsl import AbortWithNewDsl
 from fifo_dev_dsl.dia.dsl.elements.ask import Ask
 from fifo_dev_dsl.dia.dsl.elements.base import DslBase, DslContainerBase
@@ -57,7 +58,7 @@ from fifo_dev_dsl.dia.dsl.elements.propagate_slots import PropagateSlots
 from fifo_dev_dsl.dia.dsl.elements.query_fill import QueryFill
 from fifo_dev_dsl.dia.dsl.elements.query_gather import QueryGather
 from fifo_dev_dsl.dia.dsl.elements.query_user import QueryUser
-from fifo_dev_dsl.dia.dsl.elements.same_as_previous import SameAsPreviousIntent
+from fifo_dev_dsl.dia.dsl.elements.same_as_previous import same_as_previous_intent
 from fifo_dev_dsl.dia.dsl.elements.slot import Slot
 from fifo_dev_dsl.dia.dsl.elements.value_base import DSLValueBase
 from fifo_dev_dsl.dia.dsl.elements.value_fuzzy import FuzzyValue
@@ -65,6 +66,9 @@ from fifo_dev_dsl.dia.dsl.elements.value_list import ListValue
 from fifo_dev_dsl.dia.dsl.elements.value_return import ReturnValue
 from fifo_dev_dsl.dia.dsl.elements.value import Value
 
+# Splits a `name=value` argument at its first '=' and strips both sides in one match.
+_NAMED_ARG_PATTERN = re.compile(r"\s*([^=]*?)\s*=\s*(.*?)\s*", re.DOTALL)
+
 
 def parse_intent(name: str, args: str) -> Intent:
     """
@@ -92,20 +96,48 @@ def parse_intent(name: str, args: str) -> Intent:
     Example:
         parse_intent("move", 'x=add(a=1, b=2), y=-1, speed="fast"')
     """
+    return Intent(name=name, slots=_parse_named_slots(args, "Intent"))
+
+def _parse_named_slots(args: str, kind: str) -> list[Slot]:
+    # Shared by intents and PROPAGATE_SLOT, `kind` prefixes the error messages.
     slots: list[Slot] = []
     for arg in split_top_level_commas(args):
-        if '=' in arg:
-            k, v = arg.split('=', 1)
-            k, v = k.strip(), v.strip()
-            if not k:
-                raise ValueError("Intent args missing name")
-            if not v:
-                raise ValueError("Intent args missing value")
-            slots.append(Slot(k, parse_dsl_element(v, True)))
-        else:
-            raise ValueError("Intent args missing =")
-
-    return Intent(name=name, slots=slots)
+        match = _NAMED_ARG_PATTERN.fullmatch(arg)
+        if match is None:
+            raise ValueError(f"{kind} args missing =")
+        k, v = match.groups()
+        if not k:
+            raise ValueError(f"{kind} args missing name")
+        if not v:
+            raise ValueError(f"{kind} args missing value")
+        slots.append(Slot(k, _parse_trimmed_element(v, True)))
+    return slots
+
+def _parse_query_gather(args: str) -> QueryGather:
+    parts = split_top_level_commas(args)
+    if len(parts) != 2:
+        raise ValueError("Malformed QUERY_GATHER expression: "
+                         f"expected 2 arguments, got {len(parts)}")
+    return QueryGather(strip_quotes(parts[0]), strip_quotes(parts[1]))
+
+def _parse_abort_with_new_intents(args: str) -> AbortWithNewDsl:
+    return AbortWithNewDsl(
+        strict_cast(ListElement, _parse_trimmed_element(args, False, ListElement, DslBase))
+    )
+
+# Builtin constructs keyed by name, each taking the raw text between the parentheses.
+# Any other name followed by parentheses is parsed as an intent.
+_BUILTIN_PARSERS: dict[str, Callable[[str], DslBase]] = {
+    "F": lambda args: FuzzyValue(strip_quotes(args)),
+    "ASK": lambda args: Ask(strip_quotes(args)),
+    "QUERY_FILL": lambda args: QueryFill(strip_quotes(args)),
+    "QUERY_USER": lambda args: QueryUser(strip_quotes(args)),
+    "QUERY_GATHER": _parse_query_gather,
+    "SAME_AS_PREVIOUS_INTENT": lambda args: same_as_previous_intent(),
+    "PROPAGATE_SLOT": lambda args: PropagateSlots(_parse_named_slots(args, "Propagated slots")),
+    "ABORT_WITH_NEW_INTENTS": _parse_abort_with_new_intents,
+    "ABORT": lambda args: abort(),
+}
 
 U = TypeVar("U", bound=DslBase)
 T = TypeVar("T", bound=DslContainerBase[Any])
@@ -148,73 +180,52 @@ def parse_dsl_element(text: str,
         TypeError:
             If list elements do not match the expected type.
     """
+    return _parse_trimmed_element(
+        text.strip(), wrap_intent_as_value, list_type, list_content_type
+    )
 
-    text = text.strip()
-
+def _parse_trimmed_element(text: str,
+                           wrap_intent_as_value: bool,
+                           list_type: Type[T] = ListValue,
+                           list_content_type: Type[U] = DSLValueBase) -> DslBase:
+    # Body of `parse_dsl_element()` for text that is already stripped. Nested elements
+    # come from `split_top_level_commas()` or `_NAMED_ARG_PATTERN`, which both strip
+    # them, so recursive calls skip the redundant `strip()`.
     if not text:
         raise ValueError("Empty element.")
 
-    if text.startswith('[') and text.endswith(']'):
+    # Branches only depend on the delimiters at both ends of the (non-empty) text
+    first, last = text[0], text[-1]
+
+    if first == '[' and last == ']':
         # array
-        parsed_elements = [
-            strict_cast(
-                list_content_type,
-                parse_dsl_element(value, wrap_intent_as_value, list_type, list_content_type)
+        parsed_elements: list[U] = []
+        for value in split_top_level_commas(text[1:-1]):
+            element = _parse_trimmed_element(
+                value, wrap_intent_as_value, list_type, list_content_type
             )
-            for value in split_top_level_commas(text[1:-1])
-        ]
+            # Inlined type check, this loop runs once per list element
+            if not isinstance(element, list_content_type):
+                raise TypeError(f"Expected list element of type {list_content_type.__name__}, "
+                                f"got {type(element).__name__}")
+            parsed_elements.append(element)
 
         return list_type(parsed_elements)
 
-    if text.startswith('"') and text.endswith('"') or text.startswith("'") and text.endswith("'"):
+    if first == last and first in ('"', "'"):
         # string
         return Value(text[1:-1])
 
-    if "(" in text and text.endswith(")"):
+    # A single scan locates the opening parenthesis, -1 meaning this is not a call
+    open_paren = text.find("(") if last == ")" else -1
+    if open_paren != -1:
         # intent and builtins
-        open_paren = text.find("(")
         name = text[:open_paren].strip()
         args = text[open_paren+1:-1].strip()
 
-        if name == "F":
-            return FuzzyValue(strip_quotes(args))
-
-        if name == "ASK":
-            return Ask(strip_quotes(args))
-
-        if name == "QUERY_FILL":
-            return QueryFill(strip_quotes(args))
-
-        if name == "QUERY_USER":
-            return QueryUser(strip_quotes(args))
-
-        if name == "QUERY_GATHER":
-            args = split_top_level_commas(args)
-            if len(args) != 2:
-                raise ValueError("Malformed QUERY_GATHER expression: "
-                                 f"expected 2 arguments, got {len(args)}")
-            return QueryGather(strip_quotes(args[0]), strip_quotes(args[1]))
-
-        if name == "SAME_AS_PREVIOUS_INTENT":
-            return SameAsPreviousIntent()
-
-        if name == "PROPAGATE_SLOT":
-            slots: list[Slot] = []
-            for s in split_top_level_commas(args):
-                if '=' in s:
-                    k, v = s.split('=', 1)
-                    slots.append(Slot(k.strip(), parse_dsl_element(v.strip(), True)))
-                else:
-                    raise ValueError("Propagated slots args missing =")
-            return PropagateSlots(slots)
-
-        if name == "ABORT_WITH_NEW_INTENTS":
-            return AbortWithNewDsl(
-                strict_cast(ListElement, parse_dsl_element(args, False, ListElement, DslBase))
-            )
-
-        if name == "ABORT":
-            return Abort()
+        builtin_parser = _BUILTIN_PARSERS.get(name)
+        if builtin_parser is not None:
+            return builtin_parser(args)
 
         if wrap_intent_as_value:
             return ReturnValue(parse_intent(name, args))
@@ -222,6 +233,11 @@ def parse_dsl_element(text: str,
         return parse_intent(name, args)
 
     # numbers
+    if "." in text:
+        # `int(text, 0)` can never accept a dot, so decimal literals go straight to float
+        # instead of paying for a raised and caught ValueError.
+        return Value(float(text))
+
     try:
         return Value(int(text, 0))
     except ValueError:
@@ -248,5 +264,8 @@ def parse_dsl(dsl_input: str) -> ListElement:
             If any element in the input is malformed.
     """
     return ListElement(
-        items=[parse_dsl_element(element, False) for element in split_top_level_commas(dsl_input)]
+        items=[
+            _parse_trimmed_element(element, False)
+            for element in split_top_level_commas(dsl_input)
+        ]
     )
@@ -1,6 +1,6 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
+from dataclasses import dataclass, field
 
 from fifo_dev_dsl.dia.dsl.elements.propagate_slots import PropagateSlots
 from fifo_dev_dsl.dia.dsl.elements.intent_runtime_error_resolver import IntentRuntimeErrorResolver
@@ -9,8 +9,10 @@ from fifo_dev_dsl.dia.dsl.elements.ask import Ask
 from fifo_dev_dsl.dia.dsl.elements.query_gather import QueryGather
 from fifo_dev_dsl.dia.resolution.llm_call_log import LLMCallLog
 
+_NO_PROPAGATED_SLOTS: tuple[PropagateSlots, ...] = ()
 
-@dataclass
+
+@dataclass(slots=True)
 class _ResolutionState:
     """
     Snapshot of the current intent, slot and known other slots.
@@ -37,7 +39,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from fifo_dev_dsl.dia.dsl.elements.intent import Intent
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolutionContextStackElement:
     """
     Represents a single frame in the DSL resolution stack.
@@ -52,9 +54,18 @@ class ResolutionContextStackElement:
 
         idx (int):
             The index of the next child to visit within `obj`, incremented as traversal progresses.
+
+        is_leaf (bool):
+            Whether `obj` is a leaf, computed once when the frame is created. A node never
+            switches between leaf and container, so traversal can read this flag instead
+            of calling `obj.is_leaf()` on every visit.
     """
     obj: DslBase
     idx: int
+    is_leaf: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.is_leaf = self.obj.is_leaf()
 
 class ResolutionContext:
     """
@@ -101,8 +112,29 @@ class ResolutionContext:
             entering nested intents or slots. The public `intent`, `slot` and
             `other_slots` attributes provide access to the values stored at the
             top of this stack.
+
+        _top (_ResolutionState):
+            The frame at the top of `_state_stack`, kept in sync on every push and pop
+            so that the state properties do not index the stack.
+
+        _previous_qna_yaml (str):
+            Internal cache of the YAML entries rendered by `format_previous_qna_block()`,
+            covering the first `_previous_qna_count` clarifications, the last of which is
+            `_previous_qna_last`.
     """
 
+    __slots__ = (
+        "_state_stack",
+        "_top",
+        "_propagate_slots",
+        "questions_being_clarified",
+        "call_stack",
+        "llm_call_logs",
+        "_previous_qna_yaml",
+        "_previous_qna_count",
+        "_previous_qna_last",
+    )
+
     def __init__(
         self,
         intent: Intent | None = None,
@@ -118,8 +150,12 @@ class ResolutionContext:
         self._state_stack: list[_ResolutionState] = [
             _ResolutionState(intent, slot, dict(other_slots) if other_slots is not None else None)
         ]
+        self._top = self._state_stack[-1]
         self._propagate_slots: list[PropagateSlots] = _propagate_slots or []
         self.questions_being_clarified = questions_being_clarified or []
+        self._previous_qna_yaml = ""
+        self._previous_qna_count = 0
+        self._previous_qna_last: tuple[Any, ...] | None = None
         self.call_stack = call_stack or []
         self.llm_call_logs = llm_call_logs or []
 
@@ -135,7 +171,7 @@ class ResolutionContext:
             Intent | None:
                 The active intent from the top of the internal state stack.
         """
-        return self._state_stack[-1].intent
+        return self._top.intent
 
     @intent.setter
     def intent(self, value: Intent | None) -> None:
@@ -146,7 +182,7 @@ class ResolutionContext:
             value (Intent | None):
                 The intent to set as currently being resolved.
         """
-        self._state_stack[-1].intent = value
+        self._top.intent = value
 
     @property
     def slot(self) -> Slot | None:
@@ -157,7 +193,7 @@ class ResolutionContext:
             Slot | None:
                 The active slot from the top of the internal state stack.
         """
-        return self._state_stack[-1].slot
+        return self._top.slot
 
     @slot.setter
     def slot(self, value: Slot | None) -> None:
@@ -168,7 +204,7 @@ class ResolutionContext:
             value (Slot | None):
                 The slot to set as currently being resolved.
         """
-        self._state_stack[-1].slot = value
+        self._top.slot = value
 
     @property
     def other_slots(self) -> dict[str, str] | None:
@@ -179,7 +215,7 @@ class ResolutionContext:
             dict[str, str] | None:
                 A mapping of other resolved slots (excluding the current one).
         """
-        return self._state_stack[-1].other_slots
+        return self._top.other_slots
 
     @other_slots.setter
     def other_slots(self, value: dict[str, str] | None) -> None:
@@ -190,7 +226,7 @@ class ResolutionContext:
             value (dict[str, str] | None):
                 A dictionary of resolved slots excluding the current one.
         """
-        self._state_stack[-1].other_slots = value
+        self._top.other_slots = value
 
     def format_previous_qna_block(self) -> str:
         """
@@ -201,12 +237,28 @@ class ResolutionContext:
                 A YAML-formatted string representing `previous_questions_and_answers`, or
                 an empty list if no clarifications were made.
         """
-        if self.questions_being_clarified:
-            previous_qna_yaml = "\n".join(
-                f"    - question: {q}\n      answer: {a}" for _, q, a
-                                                          in self.questions_being_clarified
+        entries = self.questions_being_clarified
+        count = self._previous_qna_count
+
+        # The formatted entries are kept between calls, as the list usually only grows
+        # by one entry at a time. The cache is rebuilt if the list no longer starts with
+        # the entries it was built from (e.g. after `clear()`).
+        if count > len(entries) or (count and entries[count - 1] is not self._previous_qna_last):
+            self._previous_qna_yaml = ""
+            self._previous_qna_count = count = 0
+
+        if count < len(entries):
+            new_yaml = "\n".join(
+                f"    - question: {q}\n      answer: {a}" for _, q, a in entries[count:]
+            )
+            self._previous_qna_yaml = (
+                f"{self._previous_qna_yaml}\n{new_yaml}" if count else new_yaml
             )
-            return f"  previous_questions_and_answers:\n{previous_qna_yaml}"
+            self._previous_qna_count = len(entries)
+            self._previous_qna_last = entries[-1]
+
+        if entries:
+            return f"  previous_questions_and_answers:\n{self._previous_qna_yaml}"
         return "  previous_questions_and_answers: []"
 
     def format_call_log(self) -> str:
@@ -222,17 +274,40 @@ class ResolutionContext:
         """
         if not self.llm_call_logs:
             return ""
-        res = "---"
+        lines = ["---"]
         for call_log in self.llm_call_logs:
-            res = f"""{res}
-$
-{call_log.system_prompt}
->
-{call_log.assistant}
-<
-{call_log.answer}
----"""
-        return res
+            lines.extend((
+                "$", call_log.system_prompt,
+                ">", call_log.assistant,
+                "<", call_log.answer,
+                "---",
+            ))
+        return "\n".join(lines)
+
+    def iter_call_log(self) -> Iterator[str]:
+        """
+        Yield the output of `format_call_log()` one LLM interaction at a time.
+
+        Concatenating the yielded chunks gives the same text as `format_call_log()`,
+        but the full log is never held in memory at once, which suits callers that
+        stream long traces to a file or socket.
+
+        Yields:
+            str:
+                The leading `---` separator, then one block per call log containing
+                its system prompt, assistant completion and user answer. Nothing is
+                yielded if no call logs are present.
+        """
+        if not self.llm_call_logs:
+            return
+        yield "---"
+        for call_log in self.llm_call_logs:
+            yield "\n".join((
+                "", "$", call_log.system_prompt,
+                ">", call_log.assistant,
+                "<", call_log.answer,
+                "---",
+            ))
 
     def format_other_slots_yaml(self, padding: str="") -> str:
         """
@@ -253,10 +328,9 @@ $
         if not self.other_slots:
             return f"{padding}other_slots: {{}}"
 
-        lines = [f"{padding}other_slots:"]
-        for key, value in self.other_slots.items():
-            lines.append(f"{padding}  {key}: {value}")
-        return "\n".join(lines)
+        indent = f"{padding}  "
+        body = "\n".join([f"{indent}{key}: {value}" for key, value in self.other_slots.items()])
+        return f"{padding}other_slots:\n{body}"
 
     def add_propagated_slot(self, slot: PropagateSlots) -> None:
         """
@@ -268,15 +342,20 @@ $
         """
         self._propagate_slots.append(slot)
 
-    def take_propagated_slots(self) -> list[PropagateSlots]:
+    def take_propagated_slots(self) -> Sequence[PropagateSlots]:
         """
         Consume and return all currently pending propagated slot sets.
 
+        Nothing is allocated when no propagation is pending, which is the common case:
+        a shared empty tuple is returned and the queue is left as is.
+
         Returns:
-            list[PropagateSlots]:
+            Sequence[PropagateSlots]:
                 All accumulated propagate instructions, and clears the queue.
         """
         slots = self._propagate_slots
+        if not slots:
+            return _NO_PROPAGATED_SLOTS
         self._propagate_slots = []
         return slots
 
@@ -295,7 +374,8 @@ $
             intent (Intent):
                 The nested intent that is now being resolved.
         """
-        self._state_stack.append(_ResolutionState(intent, None, None))
+        self._top = _ResolutionState(intent, None, None)
+        self._state_stack.append(self._top)
 
     def exiting_intent(self) -> None:
         """
@@ -305,12 +385,14 @@ $
             self._state_stack.pop()
         if not self._state_stack:
             self._state_stack.append(_ResolutionState(None, None, None))
+        self._top = self._state_stack[-1]
 
     def reset_state(self) -> None:
         """
         Clear the entire state stack and reset intent and slot.
         """
-        self._state_stack = [_ResolutionState(None, None, None)]
+        self._top = _ResolutionState(None, None, None)
+        self._state_stack = [self._top]
 
     def get_intent_name(self) -> str:
         """
@@ -320,7 +402,8 @@ $
             str:
                 The intent name, or `"none"` if `self.intent` is `None`.
         """
-        return self.intent.name if self.intent else "none"
+        intent = self._top.intent
+        return intent.name if intent is not None else "none"
 
     def get_slot_name(self) -> str:
         """
@@ -330,4 +413,5 @@ $
             str:
                 The slot name, or `"none"` if `self.slot` is `None`.
         """
-        return self.slot.name if self.slot else "none"
+        slot = self._top.slot
+        return slot.name if slot is not None else "none"
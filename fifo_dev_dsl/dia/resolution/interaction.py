@@ -7,7 +7,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from fifo_dev_dsl.dia.dsl.elements.base import DslBase
     from fifo_dev_common.introspection.mini_docstring import MiniDocStringType
 
-@dataclass
+@dataclass(slots=True)
 class InteractionRequest:
     """
     Prompt generated by a DSL element asking the user for input.
@@ -54,7 +54,7 @@ class InteractionRequest:
     slot: Slot | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class InteractionAnswer:
     """
     User-provided response to an InteractionRequest.
@@ -80,7 +80,7 @@ class InteractionAnswer:
     consumed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Interaction:
     """
     User-submitted response that pairs a prior InteractionRequest with an answer.
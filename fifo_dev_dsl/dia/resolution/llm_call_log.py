@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class LLMCallLog:
     """
     Represents a single LLM interaction during DSL resolution.
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 from dataclasses import dataclass
 
 from fifo_dev_dsl.dia.resolution.enums import ResolutionResult
@@ -8,7 +8,61 @@ if TYPE_CHECKING:  # pragma: no cover
     from fifo_dev_dsl.dia.resolution.interaction import InteractionRequest
     from fifo_dev_dsl.dia.dsl.elements.base import DslBase
 
-@dataclass
+# Checked on every construction, bound once rather than looked up on the enum each time
+_UNCHANGED = ResolutionResult.UNCHANGED
+
+def _validate_interaction_requested(
+    node: DslBase | None,
+    nodes: list[DslBase] | None,
+    interaction: InteractionRequest | None
+) -> None:
+    if interaction is None:
+        raise ValueError("Missing interaction object for INTERACTION_REQUESTED")
+    if node is not None or nodes is not None:
+        raise ValueError("node and nodes must be None for INTERACTION_REQUESTED")
+
+def _validate_unchanged(
+    node: DslBase | None,
+    nodes: list[DslBase] | None,
+    interaction: InteractionRequest | None
+) -> None:
+    if node is not None or nodes is not None:
+        raise ValueError(f"node and nodes must not be set when result is {_UNCHANGED.name}")
+    if interaction is not None:
+        raise ValueError("Interaction is only allowed for INTERACTION_REQUESTED")
+
+def _validate_new_dsl_nodes(
+    node: DslBase | None,
+    nodes: list[DslBase] | None,
+    interaction: InteractionRequest | None  # pylint: disable=unused-argument
+) -> None:
+    if not nodes:
+        raise ValueError("NEW_DSL_NODES requires a non-empty list of replacement nodes")
+    if node is not None:
+        raise ValueError("node must be None when using nodes")
+
+def _validate_abort(
+    node: DslBase | None,
+    nodes: list[DslBase] | None,
+    interaction: InteractionRequest | None  # pylint: disable=unused-argument
+) -> None:
+    if nodes is not None and not nodes:
+        raise ValueError("ABORT with empty list is invalid; use None or a non-empty list")
+    if node is not None and nodes is not None:
+        raise ValueError("Cannot provide both node and nodes for ABORT")
+
+# Validation rules keyed by result, checked by `ResolutionOutcome.__init__()`.
+_VALIDATORS: dict[
+    ResolutionResult,
+    Callable[[DslBase | None, list[DslBase] | None, InteractionRequest | None], None]
+] = {
+    ResolutionResult.INTERACTION_REQUESTED: _validate_interaction_requested,
+    ResolutionResult.UNCHANGED: _validate_unchanged,
+    ResolutionResult.NEW_DSL_NODES: _validate_new_dsl_nodes,
+    ResolutionResult.ABORT: _validate_abort,
+}
+
+@dataclass(slots=True)
 class ResolutionOutcome:
     """
     Captures the outcome of resolving a DSL element during tree traversal.
@@ -57,30 +111,12 @@ class ResolutionOutcome:
         self.nodes = nodes
         self.interaction = interaction
 
-        # Validation logic
-        if result is ResolutionResult.INTERACTION_REQUESTED:
-            if interaction is None:
-                raise ValueError("Missing interaction object for INTERACTION_REQUESTED")
-            if node is not None or nodes is not None:
-                raise ValueError("node and nodes must be None for INTERACTION_REQUESTED")
-
-        elif result is ResolutionResult.UNCHANGED:
-            if node is not None or nodes is not None:
-                raise ValueError(f"node and nodes must not be set when result is {result.name}")
-            if interaction is not None:
-                raise ValueError("Interaction is only allowed for INTERACTION_REQUESTED")
-
-        elif result is ResolutionResult.NEW_DSL_NODES:
-            if not nodes:
-                raise ValueError("NEW_DSL_NODES requires a non-empty list of replacement nodes")
-            if node is not None:
-                raise ValueError("node must be None when using nodes")
-
-        elif result is ResolutionResult.ABORT:
-            if nodes is not None and not nodes:
-                raise ValueError("ABORT with empty list is invalid; use None or a non-empty list")
-            if node is not None and nodes is not None:
-                raise ValueError("Cannot provide both node and nodes for ABORT")
-
-        else:
+        # Default outcome (UNCHANGED with nothing attached) is by far the most common one
+        if (result is _UNCHANGED
+                and node is None and nodes is None and interaction is None):
+            return
+
+        validator = _VALIDATORS.get(result)
+        if validator is None:
             raise ValueError(f"Unexpected ResolutionResult: {result}")
+        validator(node, nodes, interaction)
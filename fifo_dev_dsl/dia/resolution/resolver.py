@@ -94,7 +94,7 @@ def resolve(
 
         parent.obj.update_child(parent.idx - 1, new_node)
 
-        logger.trace(f"--> in {parent} replacing {current.obj} by {new_node}")
+        logger.trace("--> in %s replacing %s by %s", parent, current.obj, new_node)
 
         resolution_context.call_stack[-1] = ResolutionContextStackElement(new_node, 0)
 
@@ -199,7 +199,7 @@ def resolve(
         current = resolution_context.call_stack[-1]
 
         try:
-            if current.obj.is_leaf():
+            if current.is_leaf:
                 if _process_current_node(current):
                     continue
             else:
@@ -1,7 +1,13 @@
+import copy
+import sys
 from typing import Any
 import pytest
 from fifo_dev_dsl.dia.dsl.parser.parser import parse_dsl_element
 from fifo_dev_dsl.dia.dsl.elements.base import DslBase, DslContainerBase
+from fifo_dev_dsl.dia.dsl.elements.element_list import ListElement
+from fifo_dev_dsl.dia.dsl.elements.slot import Slot
+from fifo_dev_dsl.dia.dsl.elements.value import Value
+from fifo_dev_dsl.dia.dsl.elements.value_fuzzy import FuzzyValue
 from fifo_dev_dsl.dia.runtime.context import LLMRuntimeContext
 
 
@@ -30,6 +36,86 @@ def test_to_dsl_representation_runs(dsl_str: str):
     assert dsl_str == result
 
 
+@pytest.mark.parametrize("dsl_str", [
+    "[1, 2.5, \"a\", F(\"some\")]",
+    "PROPAGATE_SLOT(x=1, y=foo())",
+    'foo(count=ASK("c?"), length=QUERY_FILL("between x and y"))',
+    'foo(x=bar(y=[1, F("v")]), g=QUERY_GATHER("orig", "info"), '
+    'z=SAME_AS_PREVIOUS_INTENT())',
+])
+def test_deepcopy_is_equal_and_independent(dsl_str: str) -> None:
+    obj = parse_dsl_element(dsl_str, wrap_intent_as_value=False)
+    assert isinstance(obj, DslContainerBase)
+
+    clone = copy.deepcopy(obj)
+    assert clone is not obj
+    assert clone == obj
+    assert clone.to_dsl_representation() == dsl_str
+
+    clone.remove_child(0)
+    assert obj.to_dsl_representation() == dsl_str
+
+
+def test_deepcopy_preserves_shared_nodes() -> None:
+    value = Value([1, 2])
+    clone = copy.deepcopy(ListElement([value, value]))
+
+    first, second = clone.get_children()
+    assert first is second
+    assert first is not value
+    assert first.value == [1, 2]
+    assert first.value is not value.value
+
+
+def test_value_to_dsl_representation_follows_reassignment() -> None:
+    value = Value("a")
+    assert value.to_dsl_representation() == '"a"'
+    assert value.to_dsl_representation() == '"a"'
+
+    value.value = 42
+    assert value.to_dsl_representation() == "42"
+
+
+def test_value_to_dsl_representation_follows_in_place_mutation() -> None:
+    value = Value([1, 2])
+    assert value.to_dsl_representation() == "[1, 2]"
+
+    value.value.append(3)
+    assert value.to_dsl_representation() == "[1, 2, 3]"
+
+
+def test_slot_to_dsl_representation_follows_rename() -> None:
+    slot = Slot("count", Value(3))
+    assert slot.to_dsl_representation() == "count=3"
+
+    slot.name = "".join(["len", "gth"])
+    assert slot.to_dsl_representation() == "length=3"
+    assert slot.name is sys.intern("length")
+
+
+def test_fuzzy_value_to_dsl_representation_follows_reassignment() -> None:
+    fuzzy = FuzzyValue("few")
+    assert fuzzy.to_dsl_representation() == 'F("few")'
+    assert fuzzy.to_dsl_representation() == 'F("few")'
+
+    fuzzy.value = "it's many"
+    with pytest.raises(ValueError):
+        fuzzy.to_dsl_representation()
+
+    fuzzy.value = "many"
+    assert fuzzy.to_dsl_representation() == 'F("many")'
+
+
+def test_fuzzy_value_non_string_fails_only_on_eval() -> None:
+    fuzzy = FuzzyValue(3)  # type: ignore[arg-type]
+    assert fuzzy.value == 3
+    with pytest.raises(AttributeError):
+        fuzzy.eval(None)  # type: ignore[arg-type]
+
+    fuzzy.value = "several"
+    assert fuzzy.eval(None) == 5  # type: ignore[arg-type]
+
+
 def test_dsl_base_leaf_mutations() -> None:
     base = DslBase()
     with pytest.raises(RuntimeError, match="DslBase is a leaf node"):
@@ -66,6 +66,13 @@ def test_fuzzy_value_eval() -> None:
         FuzzyValue("lots").eval(ctx)
 
 
+def test_fuzzy_value_eval_follows_reassignment() -> None:
+    ctx = runtime_context()
+    fuzzy = FuzzyValue("lots")
+    fuzzy.value = " Dozen "
+    assert fuzzy.eval(ctx) == 12
+
+
 @pytest.mark.asyncio
 async def test_fuzzy_value_eval_async() -> None:
     ctx = runtime_context()
@@ -90,6 +97,38 @@ async def test_list_value_eval_async() -> None:
     assert ty.cast(await lst.eval_async(ctx)) == [1, 2]
 
 
+def test_list_value_eval_nested() -> None:
+    ctx = runtime_context()
+    lst = ListValue([
+        Value(1),
+        ListValue([Value(2), ListValue([]), Value(3)]),
+        Value(4),
+        ListValue([ListValue([Value(5)])]),
+    ])
+    assert lst.eval(ctx) == [1, [2, [], 3], 4, [[5]]]
+
+
+@pytest.mark.asyncio
+async def test_list_value_eval_async_deeply_nested() -> None:
+    ctx = runtime_context()
+    lst = ListValue([Value(0)])
+    for i in range(1, 2000):
+        lst = ListValue([lst, Value(i)])
+
+    for result in (lst.eval(ctx), await lst.eval_async(ctx)):
+        for i in range(1999, 0, -1):
+            assert result[1] == i
+            result = result[0]
+        assert result == [0]
+
+
+@pytest.mark.asyncio
+async def test_list_value_eval_async_concurrent_keeps_order() -> None:
+    ctx = runtime_context()
+    lst = ListValue([Value(i) for i in range(20)])
+    assert await lst.eval_async_concurrent(ctx) == list(range(20))
+
+
 def test_list_element_eval_1() -> None:
     ctx = runtime_context()
     ty = MiniDocStringType("list[int]")
@@ -135,6 +174,28 @@ async def test_list_element_eval_3_async() -> None:
     assert ty.cast(await lst.eval_async(ctx)) == [1, 2]
 
 
+def test_list_element_eval_concurrent_keeps_order() -> None:
+    ctx = runtime_context()
+    lst = ListElement([Value(i) for i in range(20)])
+    assert lst.eval_concurrent(ctx, max_workers=4) == list(range(20))
+
+
+@pytest.mark.asyncio
+async def test_list_element_eval_async_concurrent_keeps_order() -> None:
+    ctx = runtime_context()
+    lst = ListElement([Value(i) for i in range(20)])
+    assert await lst.eval_async_concurrent(ctx) == list(range(20))
+
+
+def test_list_element_eval_iter_is_lazy() -> None:
+    ctx = runtime_context()
+    lst = ListElement([Value(1), Ask("?")])
+    values = lst.eval_iter(ctx)
+    assert next(values) == 1
+    with pytest.raises(RuntimeError):
+        next(values)
+
+
 def test_propagate_slots_eval() -> None:
     ctx = runtime_context()
     ps = PropagateSlots([Slot("x", Value(1)), Slot("y", Value(2))])
@@ -1,3 +1,4 @@
+import copy
 from typing import Any, Type
 import pytest
 from fifo_dev_dsl.dia.dsl.elements.base import DslBase, DslContainerBase
@@ -199,3 +200,30 @@ def test_parse_dsl_element_invalid(text: str,
                                    exc: Type[Exception]):
     with pytest.raises(exc):
         parse_dsl_element(text, wrap, list_type, list_content_type)
+
+
+def test_parse_propagate_slot_rejects_empty_slot_name() -> None:
+    # Propagated slots are parsed like intent arguments, so a missing name is an error
+    with pytest.raises(ValueError, match="Propagated slots args missing name"):
+        parse_dsl_element("PROPAGATE_SLOT(=1)", False)
+
+
+def test_parse_same_as_previous_intent_is_shared() -> None:
+    first = parse_dsl_element("SAME_AS_PREVIOUS_INTENT()", False)
+    second = parse_dsl_element("foo(x=SAME_AS_PREVIOUS_INTENT())", False)
+
+    assert isinstance(second, Intent)
+    assert first is second.slots[0].value
+    assert copy.deepcopy(second).slots[0].value is first
+    assert first == SameAsPreviousIntent()
+    assert hash(first) == hash(SameAsPreviousIntent())
+
+
+def test_parse_abort_is_shared() -> None:
+    first = parse_dsl_element("ABORT()", False)
+    second = parse_dsl_element("ABORT_WITH_NEW_INTENTS([ABORT()])", False)
+
+    assert isinstance(second, AbortWithNewDsl)
+    assert first is second.new_dsl.get_items()[0]
+    assert copy.deepcopy(first) is first
+    assert first == Abort()
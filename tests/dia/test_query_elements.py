@@ -74,3 +74,17 @@ def test_query_user_unknown_value() -> None:
     assert outcome.result is ResolutionResult.INTERACTION_REQUESTED
     assert outcome.interaction is not None
     assert outcome.interaction.message == "unknown"
+
+
+def test_query_user_parses_answer() -> None:
+    qu = QueryUser("question")
+    ctx = _runtime_context()
+    rc = ResolutionContext()
+    with patch(
+        "fifo_dev_dsl.dia.dsl.elements.query_user.call_airlock_model_server",
+        return_value="reasoning: r\nspans lines\nuser friendly answer:  We have 3 screws.\n",
+    ):
+        outcome = qu.do_resolution(ctx, rc, None)
+    assert outcome.result is ResolutionResult.INTERACTION_REQUESTED
+    assert outcome.interaction is not None
+    assert outcome.interaction.message == "We have 3 screws."
@@ -1,6 +1,12 @@
+import copy
 from fifo_dev_dsl.dia.resolution.context import ResolutionContext
 from fifo_dev_dsl.dia.dsl.elements.ask import Ask
+from fifo_dev_dsl.dia.dsl.elements.intent import Intent
+from fifo_dev_dsl.dia.dsl.elements.slot import Slot
+from fifo_dev_dsl.dia.dsl.elements.value import Value
+from fifo_dev_dsl.dia.dsl.parser.parser import parse_dsl
 from fifo_dev_dsl.dia.resolution.llm_call_log import LLMCallLog
+from fifo_dev_dsl.dia.runtime.context import LLMRuntimeContext
 
 
 def test_format_previous_qna_block_empty() -> None:
@@ -28,6 +34,38 @@ def test_format_previous_qna_block_multiple() -> None:
     assert ctx.format_previous_qna_block() == expected
 
 
+def test_format_previous_qna_block_follows_list_updates() -> None:
+    ctx = ResolutionContext()
+    ctx.questions_being_clarified.append((Ask("q1"), "q1", "a1"))
+    assert ctx.format_previous_qna_block() == (
+        "  previous_questions_and_answers:\n"
+        "    - question: q1\n"
+        "      answer: a1"
+    )
+
+    ctx.questions_being_clarified.append((Ask("q2"), "q2", "a2"))
+    assert ctx.format_previous_qna_block() == (
+        "  previous_questions_and_answers:\n"
+        "    - question: q1\n"
+        "      answer: a1\n"
+        "    - question: q2\n"
+        "      answer: a2"
+    )
+
+    ctx.questions_being_clarified.clear()
+    assert ctx.format_previous_qna_block() == "  previous_questions_and_answers: []"
+
+    ctx.questions_being_clarified.append((Ask("q3"), "q3", "a3"))
+    ctx.questions_being_clarified.append((Ask("q4"), "q4", "a4"))
+    assert ctx.format_previous_qna_block() == (
+        "  previous_questions_and_answers:\n"
+        "    - question: q3\n"
+        "      answer: a3\n"
+        "    - question: q4\n"
+        "      answer: a4"
+    )
+
+
 def test_format_call_log_empty() -> None:
     ctx = ResolutionContext()
 
@@ -47,6 +85,13 @@ def test_format_call_log_multiple() -> None:
     )
 
     assert ctx.format_call_log() == expected
+    assert "".join(ctx.iter_call_log()) == expected
+
+
+def test_iter_call_log_empty() -> None:
+    ctx = ResolutionContext()
+
+    assert list(ctx.iter_call_log()) == []
 
 
 def test_format_other_slots_yaml_empty_none() -> None:
@@ -95,3 +140,120 @@ def test_entering_and_exiting_intent() -> None:
     assert ctx.intent is intent1
     assert ctx.slot is slot
     assert ctx.other_slots == {"x": "y"}
+
+
+def test_exiting_last_intent_and_reset_state() -> None:
+    from fifo_dev_dsl.dia.dsl.elements.intent import Intent
+
+    ctx = ResolutionContext(intent=Intent("foo", []), other_slots={"x": "y"})
+
+    ctx.exiting_intent()
+    assert ctx.intent is None
+    assert ctx.other_slots is None
+    assert ctx.get_intent_name() == "none"
+
+    ctx.entering_intent(Intent("bar", []))
+    ctx.other_slots = {"a": "b"}
+    assert ctx.get_intent_name() == "bar"
+
+    ctx.reset_state()
+    assert ctx.intent is None
+    assert ctx.other_slots is None
+
+
+def test_slot_pre_resolution_other_slots_follow_resolved_values() -> None:
+    runtime_context = LLMRuntimeContext([], [])
+    count = Slot("count", Ask("how many?"))
+    length = Slot("length", Value(12))
+    intent = Intent("get_screw", [count, length])
+
+    ctx = ResolutionContext(intent=intent)
+
+    length.pre_resolution(runtime_context, ctx, None)
+    assert ctx.other_slots == {"count": 'ASK("how many?")'}
+    length.post_resolution(runtime_context, ctx, None)
+
+    count.pre_resolution(runtime_context, ctx, None)
+    assert ctx.other_slots == {"length": "12"}
+    count.update_child(0, Value(4))
+    count.post_resolution(runtime_context, ctx, None)
+
+    length.pre_resolution(runtime_context, ctx, None)
+    assert ctx.other_slots == {"count": "4"}
+
+
+def test_slot_pre_resolution_other_slots_follow_slot_mutations() -> None:
+    runtime_context = LLMRuntimeContext([], [])
+    intent = parse_dsl('f(a=[1], b=ASK("x?"))').get_children()[0]
+    assert isinstance(intent, Intent)
+    a, b = intent.slots
+
+    # Outside of a resolution pass, mutations at any depth are picked up
+    ctx = ResolutionContext(intent=intent)
+    b.pre_resolution(runtime_context, ctx, None)
+    assert ctx.other_slots == {"a": "[1]"}
+    b.post_resolution(runtime_context, ctx, None)
+
+    a.value = Value(2)
+    b.pre_resolution(runtime_context, ctx, None)
+    assert ctx.other_slots == {"a": "2"}
+    b.post_resolution(runtime_context, ctx, None)
+
+    a.value = parse_dsl("[3]").get_children()[0]
+    a.value.update_child(0, Value(4))
+    b.pre_resolution(runtime_context, ctx, None)
+    assert ctx.other_slots == {"a": "[4]"}
+    b.post_resolution(runtime_context, ctx, None)
+
+    # A change nested below the slot value is picked up by the next pass
+    pass_ctx = ResolutionContext()
+    intent.pre_resolution(runtime_context, pass_ctx, None)
+    b.pre_resolution(runtime_context, pass_ctx, None)
+    assert pass_ctx.other_slots == {"a": "[4]"}
+    b.post_resolution(runtime_context, pass_ctx, None)
+    intent.post_resolution(runtime_context, pass_ctx, None)
+
+    a.value.update_child(0, Value(5))
+    pass_ctx = ResolutionContext()
+    intent.pre_resolution(runtime_context, pass_ctx, None)
+    b.pre_resolution(runtime_context, pass_ctx, None)
+    assert pass_ctx.other_slots == {"a": "[5]"}
+    b.post_resolution(runtime_context, pass_ctx, None)
+    intent.post_resolution(runtime_context, pass_ctx, None)
+
+    clone = copy.deepcopy(intent)
+    clone_ctx = ResolutionContext(intent=clone)
+    clone.slots[1].pre_resolution(runtime_context, clone_ctx, None)
+    assert clone_ctx.other_slots == {"a": "[5]"}
+
+
+def test_slot_pre_resolution_other_slots_with_duplicate_names() -> None:
+    runtime_context = LLMRuntimeContext([], [])
+    first = Slot("a", Ask("first?"))
+    second = Slot("a", Value(2))
+    other = Slot("b", Value(3))
+    intent = Intent("f", [first, second, other])
+
+    ctx = ResolutionContext()
+    intent.pre_resolution(runtime_context, ctx, None)
+
+    other.pre_resolution(runtime_context, ctx, None)
+    assert ctx.other_slots == {"a": "2"}
+    other.post_resolution(runtime_context, ctx, None)
+
+    # Resolving the first slot does not overwrite the text of its namesake
+    first.pre_resolution(runtime_context, ctx, None)
+    assert ctx.other_slots == {"b": "3"}
+    first.update_child(0, Value(1))
+    first.post_resolution(runtime_context, ctx, None)
+
+    other.pre_resolution(runtime_context, ctx, None)
+    assert ctx.other_slots == {"a": "2"}
+    other.post_resolution(runtime_context, ctx, None)
+
+    second.pre_resolution(runtime_context, ctx, None)
+    second.update_child(0, Value(7))
+    second.post_resolution(runtime_context, ctx, None)
+
+    other.pre_resolution(runtime_context, ctx, None)
+    assert ctx.other_slots == {"a": "7"}